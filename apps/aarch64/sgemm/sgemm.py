@@ -31,9 +31,12 @@ def make_sgemm_win(p=SGEMM):
 sgemm_win = make_sgemm_win()
 
 
+# number of f32 lanes in a Neon register
+vec_width = 4
+
 micro_N = 4
 micro_M = 16
-assert micro_M % 4 == 0
+assert micro_M % vec_width == 0
 
 L1_N = 64
 L1_M = 64
@@ -77,8 +80,8 @@ def make_neon_microkernel(p=microkernel):
     # Move k to the outermost loop
     p = reorder_loops(p, "j k")
     p = reorder_loops(p, "i k")
-    # expose inner-loop for 4-wide vectorization
-    p = divide_loop(p, "j", 4, ["jo", "ji"], perfect=True)
+    # expose inner-loop for vec_width-wide vectorization
+    p = divide_loop(p, "j", vec_width, ["jo", "ji"], perfect=True)
     return p
 
 
@@ -86,9 +89,11 @@ neon_microkernel = make_neon_microkernel()
 
 
 def stage_C_microkernel(p=neon_microkernel):
-    p = stage_mem(p, "C[_] += _", "C[i, 4 * jo + ji]", "C_reg")
-    for iname in reversed(["i", "jo", "ji"]):
-        p = expand_dim(p, "C_reg", 4, iname)
+    p = stage_mem(p, "C[_] += _", f"C[i, {vec_width} * jo + ji]", "C_reg")
+    for iname, extent in reversed(
+        [("i", micro_N), ("jo", micro_M // vec_width), ("ji", vec_width)]
+    ):
+        p = expand_dim(p, "C_reg", extent, iname)
     p = lift_alloc(p, "C_reg", n_lifts=4)
     p = autofission(p, p.find("C_reg[_] = _").after(), n_lifts=4)
     p = autofission(p, p.find("C[_] = _").before(), n_lifts=4)
@@ -105,7 +110,7 @@ neon_microkernel = stage_C_microkernel()
 def stage_A_B_microkernel(p=neon_microkernel):
     for buf in ("A", "B"):
         p = bind_expr(p, f"{buf}[_]", f"{buf}_vec")
-        p = expand_dim(p, f"{buf}_vec", 4, "ji")
+        p = expand_dim(p, f"{buf}_vec", vec_width, "ji")
         p = lift_alloc(p, f"{buf}_vec")
         p = fission(p, p.find(f"{buf}_vec[_] = _").after())
         p = set_memory(p, f"{buf}_vec", Neon)
@@ -138,7 +143,6 @@ def finish_sgemm_tiled(p=sgemm_tiled):
     p = fission(p, p.find("for jo in _: _ #0").after(), n_lifts=3)
     p = repeat(reorder_loops)(p, "im jm")
     p = repeat(reorder_loops)(p, "im jo")
-    p = simplify(p)
     # stage per-tile memory at appropriate levels
     p = stage_mem(
         p,
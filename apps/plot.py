@@ -1,95 +1,118 @@
 import json
 import os
-import re
 import sys
 from collections import defaultdict
 
-import matplotlib
-import matplotlib.pyplot as plt
-import numpy as np
-
 ##
-# Get peak flops
+# Load and clean data
 
-if flops := os.getenv("MAX_GFLOPS"):
-    flops = float(flops) * 1e9
+_point_dtype = [("m", "i4"), ("n", "i4"), ("k", "i4"), ("flops", "f8")]
 
-##
-# Load and clean data
 
-matcher = re.compile(r"^sgemm_(?P<name>\w+)/(?P<m>\d+)/(?P<n>\d+)/(?P<k>\d+)$")
+def parse_name(name):
+    """
+    Split a benchmark name of the form sgemm_<series>/<m>/<n>/<k> into
+    (series, m, n, k), or return None if the name does not match.
+    """
+    parts = name.split("/")
+    if len(parts) != 4:
+        return None
+    head, m, n, k = parts
+    if not head.startswith("sgemm_") or len(head) == len("sgemm_"):
+        return None
+    if not (m.isdecimal() and n.isdecimal() and k.isdecimal()):
+        return None
+    return head[len("sgemm_") :], int(m), int(n), int(k)
 
-square_plots = defaultdict(lambda: defaultdict(list))
-aspect_plots = defaultdict(lambda: defaultdict(list))
 
-for filename in sys.argv[1:]:
-    with open(filename) as f:
-        data = json.load(f)
+def load_data(filenames):
+    import numpy as np
 
-    for point in data["benchmarks"]:
-        if m := matcher.match(point["name"]):
-            groups = m.groupdict()
-            series = groups.get("name")
+    rows = defaultdict(list)
 
-            if groups["m"] == groups["n"] == groups["k"]:
-                square_plots[series]["n"].append(float(groups["n"]))
-                square_plots[series]["flops"].append(float(point["flops"]))
+    for filename in filenames:
+        with open(filename) as f:
+            data = json.load(f)
 
-            if groups["k"] == "512":
-                aspect_plots[series]["ratio"].append(
-                    float(groups["m"]) / float(groups["n"])
-                )
-                aspect_plots[series]["flops"].append(float(point["flops"]))
+        for point in data["benchmarks"]:
+            if parsed := parse_name(point["name"]):
+                series, m, n, k = parsed
+                rows[series].append((m, n, k, float(point["flops"])))
 
-for series, points in square_plots.items():
-    points["n"], points["flops"] = zip(*sorted(zip(points["n"], points["flops"])))
+    square_plots = {}
+    aspect_plots = {}
+
+    for series, series_rows in rows.items():
+        arr = np.array(series_rows, dtype=_point_dtype)
+
+        square = arr[(arr["m"] == arr["n"]) & (arr["n"] == arr["k"])]
+        if len(square):
+            square = np.sort(square, order="n", kind="stable")
+            square_plots[series] = {
+                "n": square["n"].astype(np.float64),
+                "flops": square["flops"],
+            }
+
+        aspect = arr[arr["k"] == 512]
+        if len(aspect):
+            ratio = aspect["m"] / aspect["n"]
+            order = np.argsort(ratio, kind="stable")
+            aspect_plots[series] = {
+                "ratio": ratio[order],
+                "flops": aspect["flops"][order],
+            }
+
+    return square_plots, aspect_plots
 
-for series, points in aspect_plots.items():
-    points["ratio"], points["flops"] = zip(
-        *sorted(zip(points["ratio"], points["flops"]))
-    )
 
 ##
 # Common plotting styles for ACM one-column figure in two-column layout.
 
-# Size constants
-pts_per_inch = 72.27
-golden_ratio = (5**0.5 - 1) / 2
-
-# Get from LaTeX by writing \showthe\textwidth (prints points in log)
-latex_textwidth_pts = 240.94499
-
-# Compute figure size
-width = latex_textwidth_pts / pts_per_inch
-height = width * golden_ratio
-
-matplotlib.rcParams.update(
-    {
-        "axes.labelpad": 0,
-        "axes.labelsize": 7,
-        "axes.linewidth": 0.4,
-        "figure.figsize": (width, height),
-        "font.size": 6.25,
-        "grid.linewidth": 0.5,
-        "lines.linewidth": 0.75,
-        "font.family": "serif",
-        "font.serif": "Linux Libertine O",
-        "pgf.rcfonts": False,
-        "pgf.texsystem": "pdflatex",
-        "text.usetex": True,
-        "xtick.major.pad": 0.4,
-        "xtick.major.width": 0.4,
-        "ytick.major.pad": 0.4,
-        "ytick.major.width": 0.4,
-    }
-)
+
+def configure_matplotlib():
+    import matplotlib
+
+    # Size constants
+    pts_per_inch = 72.27
+    golden_ratio = (5**0.5 - 1) / 2
+
+    # Get from LaTeX by writing \showthe\textwidth (prints points in log)
+    latex_textwidth_pts = 240.94499
+
+    # Compute figure size
+    width = latex_textwidth_pts / pts_per_inch
+    height = width * golden_ratio
+
+    matplotlib.rcParams.update(
+        {
+            "axes.labelpad": 0,
+            "axes.labelsize": 7,
+            "axes.linewidth": 0.4,
+            "figure.figsize": (width, height),
+            "font.size": 6.25,
+            "grid.linewidth": 0.5,
+            "lines.linewidth": 0.75,
+            "font.family": "serif",
+            "font.serif": "Linux Libertine O",
+            "pgf.rcfonts": False,
+            "pgf.texsystem": "pdflatex",
+            "text.usetex": True,
+            "xtick.major.pad": 0.4,
+            "xtick.major.width": 0.4,
+            "ytick.major.pad": 0.4,
+            "ytick.major.width": 0.4,
+        }
+    )
 
 
 ##
 # Plotting function
 
 
-def plot_perf(data, filename, xkey, xlabel, xscale, ykey, ylabel):
+def plot_perf(data, filename, xkey, xlabel, xscale, ykey, ylabel, flops=None):
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     fig, ax1 = plt.subplots()
 
     color_table = {
@@ -129,28 +152,45 @@ def plot_perf(data, filename, xkey, xlabel, xscale, ykey, ylabel):
     plt.savefig(f"{filename}.pgf")
 
 
-##
-# Create aspect ratio plots
-
-plot_perf(
-    data=aspect_plots,
-    filename="sgemm_aspect_ratio",
-    xkey="ratio",
-    xlabel="Aspect ratio ($M/N$)",
-    xscale="log",
-    ykey="flops",
-    ylabel="GFLOP/s",
-)
+def main():
+    ##
+    # Get peak flops
 
-##
-# Create square-size plots
-
-plot_perf(
-    data=square_plots,
-    filename="sgemm_square",
-    xkey="n",
-    xlabel="Dimension ($M=N=K$)",
-    xscale="linear",
-    ykey="flops",
-    ylabel="GFLOP/s",
-)
+    if flops := os.getenv("MAX_GFLOPS"):
+        flops = float(flops) * 1e9
+
+    square_plots, aspect_plots = load_data(sys.argv[1:])
+
+    configure_matplotlib()
+
+    ##
+    # Create aspect ratio plots
+
+    plot_perf(
+        data=aspect_plots,
+        filename="sgemm_aspect_ratio",
+        xkey="ratio",
+        xlabel="Aspect ratio ($M/N$)",
+        xscale="log",
+        ykey="flops",
+        ylabel="GFLOP/s",
+        flops=flops,
+    )
+
+    ##
+    # Create square-size plots
+
+    plot_perf(
+        data=square_plots,
+        filename="sgemm_square",
+        xkey="n",
+        xlabel="Dimension ($M=N=K$)",
+        xscale="linear",
+        ykey="flops",
+        ylabel="GFLOP/s",
+        flops=flops,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -155,6 +155,10 @@ def compile_procs_to_strings(proc_list, h_file_name: str):
     return run_compile([p._loopir_proc for p in proc_list], h_file_name)
 
 
+# matches the 'name' or 'name #n' shorthand accepted by find_loop etc.
+_name_count_re = re.compile(r"^([a-zA-Z_]\w*)\s*(\#\s*[0-9]+)?$")
+
+
 class Procedure(ProcedureBase):
     def __init__(
         self,
@@ -192,6 +196,7 @@ class Procedure(ProcedureBase):
         self._loopir_proc = proc
         self._provenance_eq_Procedure = _provenance_eq_Procedure
         self._forward = _forward
+        self._root_cursor = None
 
     def forward(self, cur: C.Cursor):
         p = self
@@ -267,8 +272,7 @@ class Procedure(ProcedureBase):
         if not isinstance(pattern, str):
             raise TypeError("expected a pattern string")
 
-        _name_count_re = r"^([a-zA-Z_]\w*)\s*(\#\s*[0-9]+)?$"
-        results = re.search(_name_count_re, pattern)
+        results = _name_count_re.match(pattern)
         if results:
             name, count = results[1], (results[2] if results[2] else "")
             pattern = f"for {name} in _: _{count}"
@@ -276,8 +280,7 @@ class Procedure(ProcedureBase):
         return self.find(pattern, many, call_depth=1)
 
     def find_alloc_or_arg(self, pattern):
-        _name_count_re = r"^([a-zA-Z_]\w*)\s*(\#\s*[0-9]+)?$"
-        results = re.search(_name_count_re, pattern)
+        results = _name_count_re.match(pattern)
         if results:
             name, count = results[1], (results[2] if results[2] else "")
             for arg in self.args():
@@ -367,4 +370,7 @@ class Procedure(ProcedureBase):
         return eqv_set == frozenset()
 
     def _root(self):
-        return IC.Cursor.create(self._loopir_proc)
+        # procedures are never modified in place, so the root is built once
+        if self._root_cursor is None:
+            self._root_cursor = IC.Cursor.create(self._loopir_proc)
+        return self._root_cursor
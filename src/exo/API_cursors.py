@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import wraps
+from types import MappingProxyType
 
 from typing import List, Any
 
@@ -21,10 +23,32 @@ from .core.LoopIR_pprint import _print_cursor
 from .rewrite.LoopIR_scheduling import SchedulingError
 
 
+def _cached_child(method):
+    """
+    Build the child cursor returned by `method` on first use and keep it in
+    the `_<method name>_cache` slot, which the cursor class must declare.
+    Cursors are immutable, so repeated calls can share one child cursor.
+    """
+    slot = f"_{method.__name__}_cache"
+
+    @wraps(method)
+    def cached(self):
+        child = getattr(self, slot, None)
+        if child is None:
+            child = method(self)
+            setattr(self, slot, child)
+        return child
+
+    return cached
+
+
 # --------------------------------------------------------------------------- #
 # --------------------------------------------------------------------------- #
 # General Cursor Interface
 
+# Cursors are created in large numbers while scheduling, so every class in
+# this module declares __slots__ to avoid a per-instance __dict__.
+
 
 @dataclass
 class Cursor(ABC):
@@ -84,6 +108,8 @@ class Cursor(ABC):
     _impl: C.Cursor
     _proc: API.Procedure
 
+    __slots__ = ("_impl", "_proc")
+
     def __init__(self, impl, proc):
         if not isinstance(impl, C.Cursor):
             raise TypeError(
@@ -120,11 +146,19 @@ class Cursor(ABC):
 
         Raises InvalidCursorError if no parent exists
         """
-        impl_parent = self._impl.parent()
-        if isinstance(impl_parent._node, LoopIR.w_access):
-            impl_parent = impl_parent.parent()
-        elif isinstance(impl_parent._node, LoopIR.proc):
+        impl = self._impl
+        impl_parent = impl.parent()
+        if not impl_parent._path:
+            # the root of the tree is the procedure itself
             return InvalidCursor()
+        elif (
+            type(impl) is C.Node
+            and impl._path[-1][0] in ("lo", "hi", "pt")
+            and impl_parent._path[-1][0] == "idx"
+        ):
+            # w_access nodes have no cursor type; skip up to the WindowExpr.
+            # Decided from the paths alone so no nodes need to be looked up.
+            impl_parent = impl_parent.parent()
         return lift_cursor(impl_parent, self._proc)
 
     def find(self, pattern, many=False, call_depth=1):
@@ -143,6 +177,8 @@ class Cursor(ABC):
 
 
 class InvalidCursor(Cursor):
+    __slots__ = ()
+
     # noinspection PyMissingConstructor
     # we can't call the Cursor constructor since it checks the type of _impl
     def __init__(self):
@@ -167,12 +203,15 @@ class InvalidCursor(Cursor):
 
 
 class ListCursorPrototype(Cursor):
+    __slots__ = ()
+
     def __iter__(self):
         """
         iterate over all cursors contained in the list
         """
         assert isinstance(self._impl, C.Block)
-        yield from (lift_cursor(stmt_impl, self._proc) for stmt_impl in self._impl)
+        proc = self._proc
+        return (lift_cursor(impl, proc) for impl in self._impl)
 
     def __getitem__(self, i) -> Cursor:
         """
@@ -197,6 +236,8 @@ class ArgCursor(Cursor):
         ```
     """
 
+    __slots__ = ()
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.fnarg)
@@ -240,12 +281,16 @@ class StmtCursorPrototype(Cursor):
     or the expression fragment.
     """
 
+    __slots__ = ()
+
 
 class StmtCursor(StmtCursorPrototype):
     """
     Cursor pointing to an individual statement. See `help(Cursor)` for more details.
     """
 
+    __slots__ = ()
+
     def before(self) -> GapCursor:
         """
         Get a cursor pointing to the gap immediately before this statement.
@@ -296,7 +341,7 @@ class StmtCursor(StmtCursorPrototype):
         except InvalidCursorError:
             return InvalidCursor()
 
-    def as_block(self):
+    def as_block(self) -> BlockCursor:
         """Return a Block containing only this one statement"""
         assert isinstance(self._impl, C.Node)
         return BlockCursor(self._impl.as_block(), self._proc)
@@ -321,7 +366,9 @@ class BlockCursor(StmtCursorPrototype, ListCursorPrototype):
     See `help(Cursor)` for more details.
     """
 
-    def as_block(self):
+    __slots__ = ()
+
+    def as_block(self) -> BlockCursor:
         """Return this Block; included for symmetry with StmtCursor"""
         return self
 
@@ -383,6 +430,8 @@ class GapCursor(StmtCursorPrototype):
     See `help(Cursor)` for more details.
     """
 
+    __slots__ = ()
+
     def anchor(self) -> StmtCursor:
         """
         Get a cursor pointing to the node to which this gap is anchored.
@@ -405,6 +454,8 @@ class ExprCursorPrototype(Cursor):
     See `help(Cursor)` for more details.
     """
 
+    __slots__ = ()
+
 
 class ExprCursor(ExprCursorPrototype):
     """
@@ -412,6 +463,8 @@ class ExprCursor(ExprCursorPrototype):
     See `help(Cursor)` for more details.
     """
 
+    __slots__ = ()
+
     def type(self) -> API.ExoType:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.expr)
@@ -424,6 +477,8 @@ class ExprListCursor(ListCursorPrototype):
     See `help(Cursor)` for more details.
     """
 
+    __slots__ = ()
+
 
 class ArgListCursor(ListCursorPrototype):
     """
@@ -431,6 +486,8 @@ class ArgListCursor(ListCursorPrototype):
     See `help(Cursor)` for more details.
     """
 
+    __slots__ = ()
+
 
 # --------------------------------------------------------------------------- #
 # --------------------------------------------------------------------------- #
@@ -443,11 +500,14 @@ class AssignCursor(StmtCursor):
         `name [ idx ] = rhs`
     """
 
+    __slots__ = ("_idx_cache",)
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Assign)
         return self._impl._node.name.name()
 
+    @_cached_child
     def idx(self) -> ExprListCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Assign)
@@ -470,11 +530,14 @@ class ReduceCursor(StmtCursor):
         `name [ idx ] += rhs`
     """
 
+    __slots__ = ("_idx_cache",)
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Reduce)
         return self._impl._node.name.name()
 
+    @_cached_child
     def idx(self) -> ExprListCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Reduce)
@@ -492,6 +555,8 @@ class AssignConfigCursor(StmtCursor):
         `config.field = rhs`
     """
 
+    __slots__ = ()
+
     def config(self) -> Config:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.WriteConfig)
@@ -514,6 +579,8 @@ class PassCursor(StmtCursor):
         `pass`
     """
 
+    __slots__ = ()
+
 
 class IfCursor(StmtCursor):
     """
@@ -532,18 +599,22 @@ class IfCursor(StmtCursor):
     Returns an invalid cursor if `orelse` isn't present.
     """
 
+    __slots__ = ("_body_cache", "_orelse_cache")
+
     def cond(self) -> ExprCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.If)
 
         return self._child_node("cond")
 
+    @_cached_child
     def body(self) -> BlockCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.If)
 
         return BlockCursor(self._impl._child_block("body"), self._proc)
 
+    @_cached_child
     def orelse(self) -> Cursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.If)
@@ -561,6 +632,8 @@ class ForCursor(StmtCursor):
         ```
     """
 
+    __slots__ = ("_body_cache",)
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.For)
@@ -579,6 +652,7 @@ class ForCursor(StmtCursor):
 
         return self._child_node("hi")
 
+    @_cached_child
     def body(self) -> BlockCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.For)
@@ -594,6 +668,8 @@ class AllocCursor(StmtCursor):
         ```
     """
 
+    __slots__ = ()
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Alloc)
@@ -640,12 +716,15 @@ class CallCursor(StmtCursor):
         ```
     """
 
-    def subproc(self):
+    __slots__ = ("_args_cache",)
+
+    def subproc(self) -> API.Procedure:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Call)
 
         return API.Procedure(self._impl._node.f)
 
+    @_cached_child
     def args(self) -> ExprListCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Call)
@@ -661,6 +740,8 @@ class WindowStmtCursor(StmtCursor):
         ```
     """
 
+    __slots__ = ()
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.WindowStmt)
@@ -687,12 +768,15 @@ class ReadCursor(ExprCursor):
         `name [ idx ]`
     """
 
+    __slots__ = ("_idx_cache",)
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Read)
 
         return self._impl._node.name.name()
 
+    @_cached_child
     def idx(self) -> ExprListCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Read)
@@ -706,6 +790,8 @@ class ReadConfigCursor(ExprCursor):
         `config.field`
     """
 
+    __slots__ = ()
+
     def config(self) -> Config:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.ReadConfig)
@@ -729,15 +815,17 @@ class LiteralCursor(ExprCursor):
     Otherwise, it should be a control-value literal.
     """
 
+    __slots__ = ()
+
     def value(self) -> Any:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Const)
 
         n = self._impl._node
         assert (
-            (n.type.is_bool() and type(n.val) == bool)
-            or (n.type.is_indexable() and type(n.val) == int)
-            or (n.type.is_real_scalar() and type(n.val) == float)
+            (n.type.is_bool() and type(n.val) is bool)
+            or (n.type.is_indexable() and type(n.val) is int)
+            or (n.type.is_real_scalar() and type(n.val) is float)
         )
         return n.val
 
@@ -748,6 +836,8 @@ class UnaryMinusCursor(ExprCursor):
         `- arg`
     """
 
+    __slots__ = ()
+
     def arg(self) -> ExprCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.USub)
@@ -763,6 +853,8 @@ class BinaryOpCursor(ExprCursor):
         + - * / % < > <= >= == and or
     """
 
+    __slots__ = ()
+
     def op(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.BinOp)
@@ -788,12 +880,15 @@ class ExternFunctionCursor(ExprCursor):
         `name ( args )`
     """
 
+    __slots__ = ("_args_cache",)
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Extern)
 
         return self._impl._node.f.name()
 
+    @_cached_child
     def args(self) -> ExprListCursor:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.Extern)
@@ -812,6 +907,8 @@ class WindowExprCursor(ExprCursor):
     expression represents a point-access in that dimension.
     """
 
+    __slots__ = ()
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.WindowExpr)
@@ -842,6 +939,8 @@ class StrideExprCursor(ExprCursor):
     `name` is the name of some buffer or window
     """
 
+    __slots__ = ()
+
     def name(self) -> str:
         assert isinstance(self._impl, C.Node)
         assert isinstance(self._impl._node, LoopIR.StrideExpr)
@@ -859,16 +958,52 @@ class StrideExprCursor(ExprCursor):
 # --------------------------------------------------------------------------- #
 # Internal Functions; Not for Exposure to Users
 
+# read-only map from LoopIR node types to the cursor type used to wrap them
+_NODE_CURSOR_TYPES = MappingProxyType(
+    {
+        # procedure arguments
+        LoopIR.fnarg: ArgCursor,
+        # statements
+        LoopIR.Assign: AssignCursor,
+        LoopIR.Reduce: ReduceCursor,
+        LoopIR.WriteConfig: AssignConfigCursor,
+        LoopIR.Pass: PassCursor,
+        LoopIR.If: IfCursor,
+        LoopIR.For: ForCursor,
+        LoopIR.Alloc: AllocCursor,
+        LoopIR.Call: CallCursor,
+        LoopIR.WindowStmt: WindowStmtCursor,
+        # expressions
+        LoopIR.Read: ReadCursor,
+        LoopIR.ReadConfig: ReadConfigCursor,
+        LoopIR.Const: LiteralCursor,
+        LoopIR.USub: UnaryMinusCursor,
+        LoopIR.BinOp: BinaryOpCursor,
+        LoopIR.Extern: ExternFunctionCursor,
+        LoopIR.WindowExpr: WindowExprCursor,
+        LoopIR.StrideExpr: StrideExprCursor,
+    }
+)
+
+
 # helper function to dispatch to constructors
 def lift_cursor(impl, proc):
     assert isinstance(impl, C.Cursor)
     assert isinstance(proc, API.Procedure)
 
     # dispatch to the correct constructor...
-    if isinstance(impl, C.Gap):
-        return GapCursor(impl, proc)
+    # (the internal cursor types are never subclassed, so compare exactly
+    #  and reject anything else; nodes come first since they are by far the
+    #  most common case)
+    impl_type = type(impl)
+    if impl_type is C.Node:
+        n = impl._node
+        cursor_type = _NODE_CURSOR_TYPES.get(type(n))
+        if cursor_type is None:
+            raise TypeError(f"no cursor type for node of type {type(n)}")
+        return cursor_type(impl, proc)
 
-    elif isinstance(impl, C.Block):
+    elif impl_type is C.Block:
         # TODO: Rename internal Cursor type to Sequence?
         assert len(impl) > 0
         n0 = impl[0]._node
@@ -884,56 +1019,11 @@ def lift_cursor(impl, proc):
         else:
             assert False, "bad case"
 
-    elif isinstance(impl, C.Node):
-        n = impl._node
-
-        # procedure arguments
-        if isinstance(n, LoopIR.fnarg):
-            return ArgCursor(impl, proc)
-
-        # statements
-        elif isinstance(n, LoopIR.Assign):
-            return AssignCursor(impl, proc)
-        elif isinstance(n, LoopIR.Reduce):
-            return ReduceCursor(impl, proc)
-        elif isinstance(n, LoopIR.WriteConfig):
-            return AssignConfigCursor(impl, proc)
-        elif isinstance(n, LoopIR.Pass):
-            return PassCursor(impl, proc)
-        elif isinstance(n, LoopIR.If):
-            return IfCursor(impl, proc)
-        elif isinstance(n, LoopIR.For):
-            return ForCursor(impl, proc)
-        elif isinstance(n, LoopIR.Alloc):
-            return AllocCursor(impl, proc)
-        elif isinstance(n, LoopIR.Call):
-            return CallCursor(impl, proc)
-        elif isinstance(n, LoopIR.WindowStmt):
-            return WindowStmtCursor(impl, proc)
-
-        # expressions
-        elif isinstance(n, LoopIR.Read):
-            return ReadCursor(impl, proc)
-        elif isinstance(n, LoopIR.ReadConfig):
-            return ReadConfigCursor(impl, proc)
-        elif isinstance(n, LoopIR.Const):
-            return LiteralCursor(impl, proc)
-        elif isinstance(n, LoopIR.USub):
-            return UnaryMinusCursor(impl, proc)
-        elif isinstance(n, LoopIR.BinOp):
-            return BinaryOpCursor(impl, proc)
-        elif isinstance(n, LoopIR.Extern):
-            return ExternFunctionCursor(impl, proc)
-        elif isinstance(n, LoopIR.WindowExpr):
-            return WindowExprCursor(impl, proc)
-        elif isinstance(n, LoopIR.StrideExpr):
-            return StrideExprCursor(impl, proc)
-
-        else:
-            assert False, f"bad case: {type(n)}"
+    elif impl_type is C.Gap:
+        return GapCursor(impl, proc)
 
     else:
-        assert False, f"bad case: {type(impl)}"
+        raise TypeError(f"no cursor type for internal cursor {type(impl)}")
 
 
 def find(scope: C, proc: API.Procedure, pattern: str, many: bool, call_depth=1):
@@ -983,6 +1073,7 @@ __all__ = [
     "ExprCursorPrototype",
     "ExprCursor",
     "ExprListCursor",
+    "ArgListCursor",
     #
     "AssignCursor",
     "ReduceCursor",
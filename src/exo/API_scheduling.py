@@ -1,11 +1,10 @@
 # import ast as pyast
-import functools
 import inspect
 import re
 
 # import types
 from dataclasses import dataclass
-from typing import Any, List, Tuple
+from typing import Any, Tuple
 
 from .API import Procedure
 import exo.API_cursors as PC
@@ -13,7 +12,6 @@ from .core.LoopIR import LoopIR, T
 import exo.rewrite.LoopIR_scheduling as scheduling
 from .API_types import ExoType
 
-from .rewrite.LoopIR_unification import DoReplace, UnificationError
 from .core.configs import Config
 from .core.memory import Memory
 from .frontend.parse_fragment import parse_fragment
@@ -25,10 +23,24 @@ def is_subclass_obj(x, cls):
     return isinstance(x, type) and issubclass(x, cls)
 
 
+def __getattr__(name):
+    # the unification engine is loaded lazily (see replace), but
+    # UnificationError is still importable from this module
+    if name == "UnificationError":
+        from .rewrite.LoopIR_unification import UnificationError
+
+        return UnificationError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # --------------------------------------------------------------------------- #
 # --------------------------------------------------------------------------- #
 # Generic Definitions: Atomic Scheduling Operations and Argument Processing
 
+# Argument processors run on every scheduling op call, so every
+# ArgumentProcessor class in this module declares __slots__ to keep
+# attribute reads on slot lookups.
+
 
 @dataclass
 class ArgumentProcessor:
@@ -36,6 +48,8 @@ class ArgumentProcessor:
     arg_name: str
     f_name: str
 
+    __slots__ = ("i", "arg_name", "f_name")
+
     def __init__(self):
         # see setdata below for setting of the above fields
         pass
@@ -53,6 +67,8 @@ class ArgumentProcessor:
 
 
 class CursorArgumentProcessor(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, cur, all_args):
         p = all_args["proc"]
         if isinstance(cur, PC.Cursor):
@@ -68,36 +84,67 @@ class CursorArgumentProcessor(ArgumentProcessor):
 
 @dataclass
 class AtomicSchedulingOp:
-    sig: inspect.Signature
-    arg_procs: List[ArgumentProcessor]
+    arg_procs: Tuple[ArgumentProcessor, ...]
     func: Any
 
+    def __post_init__(self):
+        # every scheduling op takes only positional-or-keyword parameters,
+        # so binding reduces to lining arguments up with these names, which
+        # can be read straight off the code object
+        code = self.func.__code__
+        assert code.co_posonlyargcount == 0 and code.co_kwonlyargcount == 0
+        assert not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        self.param_names = code.co_varnames[: code.co_argcount]
+        defaults = self.func.__defaults__ or ()
+        self.defaults = dict(
+            zip(self.param_names[len(self.param_names) - len(defaults) :], defaults)
+        )
+        # the argument processing schedule, fixed once the op is built
+        self.arg_steps = tuple(
+            (nm, argp.__call__) for nm, argp in zip(self.param_names, self.arg_procs)
+        )
+
     def __str__(self):
         return f"<AtomicSchedulingOp-{self.__name__}>"
 
+    def _bind(self, args, kwargs):
+        """
+        Equivalent to `inspect.signature(self.func).bind(*args, **kwargs)`
+        with the default values patched in, but without going through inspect.
+        """
+        names = self.param_names
+        bargs = dict(zip(names, args))
+        n_kwargs = 0
+        for nm in names[len(args) :]:
+            if nm in kwargs:
+                bargs[nm] = kwargs[nm]
+                n_kwargs += 1
+            elif nm in self.defaults:
+                bargs[nm] = self.defaults[nm]
+            else:
+                break
+
+        if len(args) > len(names) or len(bargs) < len(names) or n_kwargs < len(kwargs):
+            # let inspect raise the usual TypeError for the bad call
+            inspect.signature(self.func).bind(*args, **kwargs)
+            assert False, "expected binding to fail"
+
+        return bargs
+
     def __call__(self, *args, **kwargs):
         # capture the arguments according to the provided signature
-        bound_args = self.sig.bind(*args, **kwargs)
-
-        # potentially need to patch in default values...
-        bargs = bound_args.arguments
-        if len(self.arg_procs) != len(bargs):
-            for nm in self.sig.parameters:
-                if nm not in bargs:
-                    default_val = self.sig.parameters[nm].default
-                    assert default_val != inspect.Parameter.empty
-                    kwargs[nm] = default_val
-            # now re-bind the arguments with the defaults having been added
-            bound_args = self.sig.bind(*args, **kwargs)
-            bargs = bound_args.arguments
+        if not kwargs and len(args) == len(self.param_names):
+            # every argument was passed positionally; nothing to look up
+            bargs = dict(zip(self.param_names, args))
+        else:
+            bargs = self._bind(args, kwargs)
 
         # convert the arguments using the provided argument processors
-        assert len(self.arg_procs) == len(bargs)
-        for nm, argp in zip(bargs, self.arg_procs):
-            bargs[nm] = argp(bargs[nm], bargs)
+        for nm, process in self.arg_steps:
+            bargs[nm] = process(bargs[nm], bargs)
 
         # invoke the scheduling function with the modified arguments
-        return self.func(*bound_args.args, **bound_args.kwargs)
+        return self.func(**bargs)
 
 
 # decorator for building Atomic Scheduling Operations in the
@@ -111,19 +158,24 @@ def sched_op(arg_procs):
             return argp
 
     # note pre-pending of ProcA
-    arg_procs = [check_ArgP(argp) for argp in ([ProcA] + arg_procs)]
+    arg_procs = tuple(check_ArgP(argp) for argp in [ProcA, *arg_procs])
 
     def build_sched_op(func):
         f_name = func.__name__
-        sig = inspect.signature(func)
-        assert len(arg_procs) == len(sig.parameters)
+        atomic_op = AtomicSchedulingOp(arg_procs, func)
+        assert len(arg_procs) == len(atomic_op.param_names)
 
         # record extra implicit information in the argument processors
-        for i, (param, arg_p) in enumerate(zip(sig.parameters, arg_procs)):
+        for i, (param, arg_p) in enumerate(zip(atomic_op.param_names, arg_procs)):
             arg_p.setdata(i, param, f_name)
 
-        atomic_op = AtomicSchedulingOp(sig, arg_procs, func)
-        return functools.wraps(func)(atomic_op)
+        # present the op as the function it wraps (cf. functools.wraps)
+        atomic_op.__module__ = func.__module__
+        atomic_op.__name__ = func.__name__
+        atomic_op.__qualname__ = func.__qualname__
+        atomic_op.__doc__ = func.__doc__
+        atomic_op.__wrapped__ = func
+        return atomic_op
 
     return build_sched_op
 
@@ -138,11 +190,15 @@ def is_atomic_scheduling_op(x):
 
 
 class IdA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, arg, all_args):
         return arg
 
 
 class ProcA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, proc, all_args):
         if not isinstance(proc, Procedure):
             self.err("expected a Procedure object")
@@ -150,6 +206,8 @@ class ProcA(ArgumentProcessor):
 
 
 class MemoryA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, mem, all_args):
         if not is_subclass_obj(mem, Memory):
             self.err("expected a Memory subclass")
@@ -157,6 +215,8 @@ class MemoryA(ArgumentProcessor):
 
 
 class ConfigA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, config, all_args):
         if not isinstance(config, Config):
             self.err("expected a Config object")
@@ -164,6 +224,8 @@ class ConfigA(ArgumentProcessor):
 
 
 class ConfigFieldA(ArgumentProcessor):
+    __slots__ = ("cfg_arg",)
+
     def __init__(self, config_arg_name="config"):
         self.cfg_arg = config_arg_name
 
@@ -180,6 +242,8 @@ class ConfigFieldA(ArgumentProcessor):
 
 
 class NameA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, name, all_args):
         if not is_valid_name(name):
             self.err("expected a valid name")
@@ -187,20 +251,27 @@ class NameA(ArgumentProcessor):
 
 
 class PosIntA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, val, all_args):
-        if not is_pos_int(val):
+        if isinstance(val, bool) or not is_pos_int(val):
             self.err("expected a positive integer")
         return val
 
 
 class IntA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, val, all_args):
-        if not isinstance(val, int):
+        # bools are ints too, but are never meant as one here
+        if not isinstance(val, int) or isinstance(val, bool):
             self.err("expected an integer")
         return val
 
 
 class BoolA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, bval, all_args):
         if not isinstance(bval, bool):
             self.err("expected a bool")
@@ -208,9 +279,14 @@ class BoolA(ArgumentProcessor):
 
 
 class OptionalA(ArgumentProcessor):
+    __slots__ = ("arg_proc",)
+
     def __init__(self, arg_proc):
         if is_subclass_obj(arg_proc, ArgumentProcessor):
             arg_proc = arg_proc()
+        # an optional optional argument is just an optional argument
+        if isinstance(arg_proc, OptionalA):
+            arg_proc = arg_proc.arg_proc
         self.arg_proc = arg_proc
 
     def setdata(self, i, arg_name, f_name):
@@ -225,6 +301,8 @@ class OptionalA(ArgumentProcessor):
 
 
 class DictA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, d, all_args):
         if not isinstance(d, dict):
             self.err("expected a dict")
@@ -232,6 +310,8 @@ class DictA(ArgumentProcessor):
 
 
 class ListA(ArgumentProcessor):
+    __slots__ = ("elem_arg_proc", "list_only", "fixed_length")
+
     def __init__(self, elem_arg_proc, list_only=False, length=None):
         if is_subclass_obj(elem_arg_proc, ArgumentProcessor):
             elem_arg_proc = elem_arg_proc()
@@ -254,11 +334,14 @@ class ListA(ArgumentProcessor):
             if len(xs) != self.fixed_length:
                 self.err(f"expected a list of length {self.fixed_length}")
         # otherwise, check the entries
-        xs = [self.elem_arg_proc(x, all_args) for x in xs]
+        check_elem = self.elem_arg_proc.__call__
+        xs = [check_elem(x, all_args) for x in xs]
         return xs
 
 
 class ListOrElemA(ListA):
+    __slots__ = ()
+
     def __call__(self, xs, all_args):
         arg_typ = list if self.list_only else (list, tuple)
         if isinstance(xs, arg_typ):
@@ -268,20 +351,34 @@ class ListOrElemA(ListA):
 
 
 class InstrStrA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, instr, all_args):
         if not isinstance(instr, str):
             self.err("expected an instruction macro " "(i.e. a string with {} escapes)")
         return instr
 
 
-_name_count_re = r"^([a-zA-Z_]\w*)\s*(\#\s*([0-9]+))?$"
+_name_count_re = re.compile(r"^([a-zA-Z_]\w*)\s*(\#\s*([0-9]+))?$")
+
+
+def _match_name_count(pattern):
+    """
+    If `pattern` is a string of the form `<ident> [# <int>]?`, return the
+    pair (name, count), with count None when omitted; otherwise None.
+    """
+    if isinstance(pattern, str) and (results := _name_count_re.match(pattern)):
+        return results[1], int(results[3]) if results[3] else None
+    return None
 
 
 class NameCountA(ArgumentProcessor):
+    __slots__ = ()
+
     def __call__(self, name_count, all_args):
         if not isinstance(name_count, str):
             self.err("expected a string")
-        results = re.search(_name_count_re, name_count)
+        results = _name_count_re.match(name_count)
         if not results:
             self.err(
                 "expected a name pattern of the form\n"
@@ -298,18 +395,24 @@ class NameCountA(ArgumentProcessor):
 
 
 class EnumA(ArgumentProcessor):
+    __slots__ = ("enum_vals", "vals_str")
+
     def __init__(self, enum_vals):
         assert isinstance(enum_vals, list)
         self.enum_vals = enum_vals
+        self.vals_str = ", ".join([str(v) for v in enum_vals])
 
     def __call__(self, arg, all_args):
         if arg not in self.enum_vals:
-            vals_str = ", ".join([str(v) for v in self.enum_vals])
-            self.err(f"expected one of the following values: {vals_str}", ValueError)
+            self.err(
+                f"expected one of the following values: {self.vals_str}", ValueError
+            )
         return arg
 
 
 class TypeAbbrevA(ArgumentProcessor):
+    __slots__ = ()
+
     _shorthand = {
         "R": T.R,
         ExoType.R: T.R,
@@ -328,6 +431,7 @@ class TypeAbbrevA(ArgumentProcessor):
         "i32": T.int32,
         ExoType.I32: T.i32,
     }
+    _precisions = ", ".join([t for t in _shorthand if type(t) is str])
 
     def __call__(self, typ, all_args):
         if not isinstance(typ, (str, ExoType)):
@@ -335,18 +439,15 @@ class TypeAbbrevA(ArgumentProcessor):
                 f"expected an instance of {ExoType} or {str} specifying the precision",
                 TypeError,
             )
-        assert not isinstance(typ, ExoType) or typ in TypeAbbrevA._shorthand
-        if typ in TypeAbbrevA._shorthand:
-            return TypeAbbrevA._shorthand[typ]
-        else:
-            precisions = ", ".join(
-                [t for t in TypeAbbrevA._shorthand if type(t) is str]
-            )
+        t = TypeAbbrevA._shorthand.get(typ)
+        assert not isinstance(typ, ExoType) or t is not None
+        if t is None:
             self.err(
                 f"expected an instance of {ExoType} or one of the following strings specifying "
-                f"precision: {precisions}",
+                f"precision: {TypeAbbrevA._precisions}",
                 ValueError,
             )
+        return t
 
 
 # --------------------------------------------------------------------------- #
@@ -355,21 +456,17 @@ class TypeAbbrevA(ArgumentProcessor):
 
 
 class ExprCursorA(CursorArgumentProcessor):
+    __slots__ = ("match_many",)
+
     def __init__(self, many=False):
         self.match_many = many
 
     def _cursor_call(self, expr_pattern, all_args):
         if self.match_many:
             if isinstance(expr_pattern, list):
-                if all(isinstance(ec, PC.ExprCursor) for ec in expr_pattern):
-                    return expr_pattern
-                else:
-                    for ec in expr_pattern:
-                        if not isinstance(ec, PC.ExprCursor):
-                            self.err(
-                                f"expected a list of ExprCursor, "
-                                f"not {type(expr_pattern)}"
-                            )
+                if not all(isinstance(ec, PC.ExprCursor) for ec in expr_pattern):
+                    self.err(f"expected a list of ExprCursor, not {type(expr_pattern)}")
+                return expr_pattern
             elif not isinstance(expr_pattern, str):
                 self.err("expected an ExprCursor or pattern string")
         else:
@@ -384,11 +481,9 @@ class ExprCursorA(CursorArgumentProcessor):
         matches = proc.find(expr_pattern, many=self.match_many, call_depth=1)
 
         if self.match_many:
-            for m in matches:
-                if not isinstance(m, PC.ExprCursor):
-                    self.err(
-                        f"expected pattern to match only ExprCursors, not {type(m)}"
-                    )
+            if not all(isinstance(m, PC.ExprCursor) for m in matches):
+                m = next(m for m in matches if not isinstance(m, PC.ExprCursor))
+                self.err(f"expected pattern to match only ExprCursors, not {type(m)}")
             return matches
         else:
             match = matches
@@ -398,15 +493,17 @@ class ExprCursorA(CursorArgumentProcessor):
 
 
 class StmtCursorA(CursorArgumentProcessor):
+    __slots__ = ("match_many",)
+
     def __init__(self, many=False):
         self.match_many = many
 
     def _cursor_call(self, stmt_pattern, all_args):
         if isinstance(stmt_pattern, PC.StmtCursor):
             return stmt_pattern
-        elif isinstance(stmt_pattern, PC.Cursor):
-            self.err(f"expected an StmtCursor, not {type(stmt_pattern)}")
         elif not isinstance(stmt_pattern, str):
+            if isinstance(stmt_pattern, PC.Cursor):
+                self.err(f"expected an StmtCursor, not {type(stmt_pattern)}")
             self.err("expected a StmtCursor or pattern string")
 
         proc = all_args["proc"]
@@ -420,22 +517,25 @@ class StmtCursorA(CursorArgumentProcessor):
 
 
 class BlockCursorA(CursorArgumentProcessor):
+    __slots__ = ("match_many", "block_size")
+
     def __init__(self, many=False, block_size=None):
         self.match_many = many
         self.block_size = block_size
 
     def _cursor_call(self, block_pattern, all_args):
-        if isinstance(block_pattern, PC.BlockCursor):
+        # BlockCursor has no subclasses, so an exact type test suffices
+        if type(block_pattern) is PC.BlockCursor:
             cursor = block_pattern
         elif isinstance(block_pattern, PC.StmtCursor):
             cursor = block_pattern.as_block()
         else:
-            if isinstance(block_pattern, PC.Cursor):
-                self.err(
-                    f"expected a StmtCursor or BlockCursor, "
-                    f"not {type(block_pattern)}"
-                )
-            elif not isinstance(block_pattern, str):
+            if not isinstance(block_pattern, str):
+                if isinstance(block_pattern, PC.Cursor):
+                    self.err(
+                        f"expected a StmtCursor or BlockCursor, "
+                        f"not {type(block_pattern)}"
+                    )
                 self.err("expected a Cursor or pattern string")
 
             proc = all_args["proc"]
@@ -444,7 +544,7 @@ class BlockCursorA(CursorArgumentProcessor):
             match = matches[0] if self.match_many else matches
             if isinstance(match, PC.StmtCursor):
                 match = match.as_block()
-            elif not isinstance(match, PC.BlockCursor):
+            elif type(match) is not PC.BlockCursor:
                 self.err(f"expected pattern to match a BlockCursor, not {type(match)}")
             cursor = match
 
@@ -461,6 +561,8 @@ class BlockCursorA(CursorArgumentProcessor):
 
 
 class GapCursorA(CursorArgumentProcessor):
+    __slots__ = ()
+
     def _cursor_call(self, gap_cursor, all_args):
         if not isinstance(gap_cursor, PC.GapCursor):
             self.err("expected a GapCursor")
@@ -468,13 +570,13 @@ class GapCursorA(CursorArgumentProcessor):
 
 
 class AllocCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, alloc_pattern, all_args):
-        try:
-            name, count = NameCountA()(alloc_pattern, all_args)
+        if name_count := _match_name_count(alloc_pattern):
+            name, count = name_count
             count = f" #{count}" if count is not None else ""
             alloc_pattern = f"{name} : _{count}"
-        except:
-            pass
 
         cursor = super()._cursor_call(alloc_pattern, all_args)
         if not isinstance(cursor, PC.AllocCursor):
@@ -483,6 +585,8 @@ class AllocCursorA(StmtCursorA):
 
 
 class WindowStmtCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, alloc_pattern, all_args):
         cursor = super()._cursor_call(alloc_pattern, all_args)
         if not isinstance(cursor, PC.WindowStmtCursor):
@@ -491,16 +595,16 @@ class WindowStmtCursorA(StmtCursorA):
 
 
 class ForOrIfCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, cursor_pat, all_args):
         # TODO: eliminate this redundancy with the ForCursorA code
         # allow for a special pattern short-hand, but otherwise
         # handle as expected for a normal statement cursor
-        try:
-            name, count = NameCountA()(cursor_pat, all_args)
+        if name_count := _match_name_count(cursor_pat):
+            name, count = name_count
             count = f"#{count}" if count is not None else ""
             cursor_pat = f"for {name} in _: _{count}"
-        except:
-            pass
 
         cursor = super()._cursor_call(cursor_pat, all_args)
         if not isinstance(cursor, (PC.ForCursor, PC.IfCursor)):
@@ -509,6 +613,8 @@ class ForOrIfCursorA(StmtCursorA):
 
 
 class ArgCursorA(CursorArgumentProcessor):
+    __slots__ = ()
+
     def _cursor_call(self, arg_pattern, all_args):
         if isinstance(arg_pattern, PC.ArgCursor):
             return arg_pattern
@@ -525,13 +631,13 @@ class ArgCursorA(CursorArgumentProcessor):
 
 
 class ArgOrAllocCursorA(CursorArgumentProcessor):
+    __slots__ = ()
+
     def _cursor_call(self, alloc_pattern, all_args):
-        try:
-            name, count = NameCountA()(alloc_pattern, all_args)
+        if name_count := _match_name_count(alloc_pattern):
+            name, count = name_count
             count = f" #{count}" if count is not None else ""
             alloc_pattern = f"{name} : _{count}"
-        except:
-            pass
 
         cursor = alloc_pattern
         if not isinstance(cursor, (PC.AllocCursor, PC.ArgCursor)):
@@ -554,15 +660,15 @@ class ArgOrAllocCursorA(CursorArgumentProcessor):
 
 
 class ForCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, loop_pattern, all_args):
         # allow for a special pattern short-hand, but otherwise
         # handle as expected for a normal statement cursor
-        try:
-            name, count = NameCountA()(loop_pattern, all_args)
+        if name_count := _match_name_count(loop_pattern):
+            name, count = name_count
             count = f" #{count}" if count is not None else ""
             loop_pattern = f"for {name} in _: _{count}"
-        except:
-            pass
 
         cursor = super()._cursor_call(loop_pattern, all_args)
         if not isinstance(cursor, PC.ForCursor):
@@ -571,6 +677,8 @@ class ForCursorA(StmtCursorA):
 
 
 class IfCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, if_pattern, all_args):
         cursor = super()._cursor_call(if_pattern, all_args)
         if not isinstance(cursor, PC.IfCursor):
@@ -578,17 +686,21 @@ class IfCursorA(StmtCursorA):
         return cursor
 
 
-_name_name_count_re = r"^([a-zA-Z_]\w*)\s*([a-zA-Z_]\w*)\s*(\#\s*([0-9]+))?$"
+_name_name_count_re = re.compile(
+    r"^([a-zA-Z_]\w*)\s*([a-zA-Z_]\w*)\s*(\#\s*([0-9]+))?$"
+)
 
 
 class NestedForCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, loops_pattern, all_args):
         if isinstance(loops_pattern, PC.ForCursor):
             cursor = loops_pattern
         elif isinstance(loops_pattern, PC.Cursor):
             self.err(f"expected a ForCursor, not {type(loops_pattern)}")
         elif isinstance(loops_pattern, str) and (
-            match_result := re.search(_name_name_count_re, loops_pattern)
+            match_result := _name_name_count_re.match(loops_pattern)
         ):
             out_name = match_result[1]
             in_name = match_result[2]
@@ -617,6 +729,8 @@ class NestedForCursorA(StmtCursorA):
 
 
 class AssignCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, stmt_pattern, all_args):
         cursor = super()._cursor_call(stmt_pattern, all_args)
         if not isinstance(cursor, PC.AssignCursor):
@@ -625,6 +739,8 @@ class AssignCursorA(StmtCursorA):
 
 
 class AssignOrReduceCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, stmt_pattern, all_args):
         cursor = super()._cursor_call(stmt_pattern, all_args)
         if not isinstance(cursor, (PC.AssignCursor, PC.ReduceCursor)):
@@ -633,17 +749,17 @@ class AssignOrReduceCursorA(StmtCursorA):
 
 
 class CallCursorA(StmtCursorA):
+    __slots__ = ()
+
     def _cursor_call(self, call_pattern, all_args):
         # allow for special pattern short-hands, but otherwise
         # handle as expected for a normal statement cursor
         if isinstance(call_pattern, Procedure):
             call_pattern = f"{call_pattern.name()}(_)"
-        try:
-            name, count = NameCountA()(call_pattern, all_args)
+        if name_count := _match_name_count(call_pattern):
+            name, count = name_count
             count = f" #{count}" if count is not None else ""
             call_pattern = f"{name}(_){count}"
-        except:
-            pass
 
         cursor = super()._cursor_call(call_pattern, all_args)
         if not isinstance(cursor, PC.CallCursor):
@@ -682,6 +798,8 @@ class FormattedExprStr:
 
 
 class NewExprA(ArgumentProcessor):
+    __slots__ = ("cursor_arg", "before")
+
     def __init__(self, cursor_arg, before=True):
         self.cursor_arg = cursor_arg
         self.before = before
@@ -698,14 +816,20 @@ class NewExprA(ArgumentProcessor):
         # TODO: improve parse_fragment to just take gaps
         return cursor.anchor()._impl._node
 
+    # types of Python constants accepted in place of an expression string;
+    # keyed on the exact type, since bool would otherwise pass for int
+    _const_types = {int: T.int, float: T.R, bool: T.bool}
+
     def __call__(self, expr_str, all_args):
         expr_holes = None
-        if isinstance(expr_str, int):
-            return LoopIR.Const(expr_str, T.int, null_srcinfo())
+        if const_typ := NewExprA._const_types.get(type(expr_str)):
+            return LoopIR.Const(expr_str, const_typ, null_srcinfo())
+        elif isinstance(expr_str, int):
+            # subclasses such as IntEnum (bool is handled above)
+            return LoopIR.Const(int(expr_str), T.int, null_srcinfo())
         elif isinstance(expr_str, float):
-            return LoopIR.Const(expr_str, T.R, null_srcinfo())
-        elif isinstance(expr_str, bool):
-            return LoopIR.Const(expr_str, T.bool, null_srcinfo())
+            # subclasses such as np.float64
+            return LoopIR.Const(float(expr_str), T.R, null_srcinfo())
         elif isinstance(expr_str, FormattedExprStr):
             expr_str, expr_holes = expr_str._expr_str, expr_str._expr_holes
         elif not isinstance(expr_str, str):
@@ -720,10 +844,16 @@ class NewExprA(ArgumentProcessor):
         return expr
 
 
+_window_re = re.compile(r"(\w+)\[([^\]]+)\]")
+_window_arg_re = re.compile(r"\s*([^:]+)\s*:\s*([^:]+)\s*")
+
+
 # This is implemented as a workaround because the
 # current PAST parser and PAST IR don't support windowing
 # expressions.
 class CustomWindowExprA(NewExprA):
+    __slots__ = ()
+
     def __call__(self, expr_str, all_args):
         proc = all_args["proc"]
         ctxt_stmt = self._get_ctxt_stmt(all_args)
@@ -733,7 +863,7 @@ class CustomWindowExprA(NewExprA):
             return expr_str, []
 
         # otherwise, we have multiple dimensions
-        match = re.match(r"(\w+)\[([^\]]+)\]", expr_str)
+        match = _window_re.match(expr_str)
         if not match:
             raise ValueError(
                 f"expected windowing string of the form "
@@ -746,7 +876,8 @@ class CustomWindowExprA(NewExprA):
         loopir = proc._loopir_proc
 
         def parse_arg(a):
-            match = re.match(r"\s*([^:]+)\s*:\s*([^:]+)\s*", a)
+            # a point index can't match the interval regex; skip running it
+            match = ":" in a and _window_arg_re.match(a)
             if not match:
                 # a.strip() to remove whitespace
                 pt = parse_fragment(loopir, a.strip(), ctxt_stmt)
@@ -763,6 +894,8 @@ class CustomWindowExprA(NewExprA):
 
 
 class NewExprOrCustomWindowExprA(NewExprA):
+    __slots__ = ()
+
     def __call__(self, expr_str, all_args):
         try:
             return NewExprA(self.cursor_arg, self.before)(expr_str, all_args)
@@ -1088,6 +1221,10 @@ def replace(proc, block_cursor, subproc, quiet=False):
         quiet           - (bool) control how much this operation prints
                           out debug info
     """
+    # only replace needs the unification engine, so it is loaded on first
+    # use rather than on every `import exo`
+    from .rewrite.LoopIR_unification import DoReplace, UnificationError
+
     try:
         ir, fwd = DoReplace(subproc._loopir_proc, block_cursor._impl)
         return Procedure(ir, _provenance_eq_Procedure=proc, _forward=fwd)
@@ -1095,7 +1232,8 @@ def replace(proc, block_cursor, subproc, quiet=False):
         if quiet:
             raise
         print(f"Failed to unify the following:\nSubproc:\n{subproc}\nStatements:")
-        [print(sc._impl._node) for sc in block_cursor]
+        for sc in block_cursor:
+            print(sc._impl._node)
         raise
 
 
@@ -1246,7 +1384,10 @@ def write_config(proc, gap_cursor, config, field, rhs):
                       should be inserted
         config      - config object to be written into
         field       - (string) the field of `config` to be written to
-        rhs         - (string) the expression to write into the field
+        rhs         - (string) the expression to write into the field.
+                      A Python bool, int or float is also accepted and
+                      becomes a bool, index or R literal respectively;
+                      True/False are boolean literals, not 1/0.
 
     rewrite:
         `s1 ; s3    ->    s1 ; config.field = new_expr ; s3`
@@ -1434,8 +1575,9 @@ def mult_dim(proc, alloc_cursor, hi_dim_idx, lo_dim_idx):
         `x[4*i + k, j] = ...`
     """
     stmt = alloc_cursor._impl
+    n_dims = len(stmt._node.type.shape())
     for dim_idx in [hi_dim_idx, lo_dim_idx]:
-        if not (0 <= dim_idx < len(stmt._node.type.shape())):
+        if not (0 <= dim_idx < n_dims):
             raise ValueError(f"Cannot multiply out-of-bounds dimension index {dim_idx}")
     if hi_dim_idx == lo_dim_idx:
         raise ValueError(f"Cannot multiply dimension {hi_dim_idx} by itself")
@@ -1466,14 +1608,15 @@ def unroll_buffer(proc, alloc_cursor, dimension):
     return Procedure(ir, _provenance_eq_Procedure=proc, _forward=fwd)
 
 
-@sched_op([AllocCursorA, PosIntA])
+@sched_op([AllocCursorA, OptionalA(PosIntA)])
 def lift_alloc(proc, alloc_cursor, n_lifts=1):
     """
     Lift a buffer allocation up and out of various Loops / If-statements.
 
     args:
         alloc_cursor    - cursor to the allocation to lift up
-        n_lifts         - number of times to try to move the allocation up
+        n_lifts         - number of times to try to move the allocation up,
+                          or None to lift it as far as possible
 
     rewrite:
         `for i in _:`
@@ -2138,14 +2281,15 @@ def fuse(proc, stmt1, stmt2, unsafe_disable_check=False):
         `    s1`
         `    s2`
     """
-    if isinstance(stmt1, PC.IfCursor) != isinstance(stmt2, PC.IfCursor):
+    is_if = type(stmt1) is PC.IfCursor
+    if is_if != (type(stmt2) is PC.IfCursor):
         raise ValueError(
             "expected the two argument cursors to either both "
             "point to loops or both point to if-guards"
         )
     s1 = stmt1._impl
     s2 = stmt2._impl
-    if isinstance(stmt1, PC.IfCursor):
+    if is_if:
         ir, fwd = scheduling.DoFuseIf(s1, s2)
     else:
         ir, fwd = scheduling.DoFuseLoop(s1, s2, unsafe_disable_check)
@@ -2172,7 +2316,7 @@ def remove_loop(proc, loop_cursor, unsafe_disable_check=False):
     return Procedure(ir, _provenance_eq_Procedure=proc, _forward=fwd)
 
 
-@sched_op([BlockCursorA, NameA, NewExprA("block_cursor"), BoolA, BoolA])
+@sched_op([BlockCursorA(block_size=1), NameA, NewExprA("block_cursor"), BoolA, BoolA])
 def add_loop(
     proc, block_cursor, iter_name, hi_expr, guard=False, unsafe_disable_check=False
 ):
@@ -2198,10 +2342,7 @@ def add_loop(
         `    s`
     """
 
-    if len(block_cursor) != 1:
-        raise NotImplementedError("TODO: support blocks of size > 1")
-
-    stmt_c = block_cursor[0]._impl
+    stmt_c = block_cursor._impl[0]
     ir, fwd = scheduling.DoAddLoop(
         stmt_c, iter_name, hi_expr, guard, unsafe_disable_check
     )
@@ -2261,6 +2402,34 @@ def lift_scope(proc, scope_cursor):
     return Procedure(ir, _provenance_eq_Procedure=proc, _forward=fwd)
 
 
+@sched_op([ForOrIfCursorA])
+def lift_scope_to_top(proc, scope_cursor):
+    """
+    Lift the indicated For/If-statement upwards as many scopes as possible,
+    stopping at the top level or at the first scope it cannot be lifted out
+    of. Equivalent to repeatedly calling `lift_scope`, but the result is
+    only packaged into a Procedure once.
+
+    args:
+        scope_cursor       - cursor to the inner scope statement to lift up
+
+    rewrite: (one example)
+        `for i in _:`
+        `    for j in _:`
+        `        if p:`
+        `            s1`
+        ->
+        `if p:`
+        `    for i in _:`
+        `        for j in _:`
+        `            s1`
+    """
+    stmt_c = scope_cursor._impl
+
+    ir, fwd = scheduling.DoLiftScopeToTop(stmt_c)
+    return Procedure(ir, _provenance_eq_Procedure=proc, _forward=fwd)
+
+
 @sched_op([ForOrIfCursorA])
 def eliminate_dead_code(proc, stmt_cursor):
     """
@@ -2328,4 +2497,5 @@ def add_unsafe_guard(proc, block_cursor, var_expr):
     """
     stmt = block_cursor._impl[0]
 
-    return scheduling.DoAddUnsafeGuard(proc, stmt, var_expr).result()
+    ir, fwd = scheduling.DoAddUnsafeGuard(stmt, var_expr)
+    return Procedure(ir, _provenance_eq_Procedure=proc, _forward=fwd)
@@ -22,17 +22,19 @@ class ParseFragmentError(Exception):
 def parse_fragment(
     proc, fragment, ctx_stmt, call_depth=1, configs=[], scope="before", expr_holes=None
 ):
-    stack_frames: [inspect.FrameInfo] = inspect.stack()
-    # get source location where this is getting called from
-    caller = inspect.getframeinfo(stack_frames[call_depth][0])
-    func_locals = ChainMap(stack_frames[call_depth].frame.f_locals)
-    func_globals = ChainMap(stack_frames[call_depth].frame.f_globals)
+    # get the frame where this is getting called from; walk f_back directly
+    # rather than using inspect.stack(), which loads source for every frame
+    caller = inspect.currentframe()
+    for _ in range(call_depth):
+        caller = caller.f_back
+    func_locals = ChainMap(caller.f_locals)
+    func_globals = ChainMap(caller.f_globals)
 
     # parse the pattern we're going to use to match
     p_ast = pyparser.pattern(
         fragment,
-        filename=caller.filename,
-        lineno=caller.lineno,
+        filename=caller.f_code.co_filename,
+        lineno=caller.f_lineno,
         srclocals=func_locals,
         srcglobals=func_globals,
     )
@@ -63,6 +65,8 @@ _PAST_to_LoopIR = {
 
 
 class BuildEnv(LoopIR_Do):
+    # only statements bind names, so there is no need to descend into
+    # expressions or types
     def __init__(self, proc, stmt):
         self.env = ChainMap()
         self.result = None
@@ -72,9 +76,6 @@ class BuildEnv(LoopIR_Do):
 
         for a in self.proc.args:
             self.env[a.name] = a.type
-            self.do_t(a.type)
-        for p in self.proc.preds:
-            self.do_e(p)
 
         self.do_stmts(self.proc.body)
 
@@ -97,29 +98,19 @@ class BuildEnv(LoopIR_Do):
         styp = type(s)
         if styp is LoopIR.Assign or styp is LoopIR.Reduce:
             self.env[s.name] = s.type
-            for e in s.idx:
-                self.do_e(e)
-            self.do_e(s.rhs)
-            self.do_t(s.type)
         elif styp is LoopIR.For:
             self.push()
             self.env[s.iter] = T.index
-            self.do_e(s.lo)
-            self.do_e(s.hi)
             self.do_stmts(s.body)
             self.pop()
         elif styp is LoopIR.If:
             self.push()
-            self.do_e(s.cond)
             self.do_stmts(s.body)
             if len(s.orelse) > 0:
                 self.do_stmts(s.orelse)
             self.pop()
         elif styp is LoopIR.Alloc:
             self.env[s.name] = s.type
-            self.do_t(s.type)
-        else:
-            super().do_s(s)
 
 
 class BuildEnv_after(LoopIR_Do):
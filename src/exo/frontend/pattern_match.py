@@ -79,17 +79,19 @@ def match_pattern(
     else:
         match_no = default_match_no  # None means match-all
 
-    stack_frames: [inspect.FrameInfo] = inspect.stack()
-    # get source location where this is getting called from
-    caller = inspect.getframeinfo(stack_frames[call_depth][0])
-    func_locals = ChainMap(stack_frames[call_depth].frame.f_locals)
-    func_globals = ChainMap(stack_frames[call_depth].frame.f_globals)
+    # get the frame where this is getting called from; walk f_back directly
+    # rather than using inspect.stack(), which loads source for every frame
+    caller = inspect.currentframe()
+    for _ in range(call_depth):
+        caller = caller.f_back
+    func_locals = ChainMap(caller.f_locals)
+    func_globals = ChainMap(caller.f_globals)
 
     # parse the pattern we're going to use to match
     p_ast = pyparser.pattern(
         pattern_str,
-        filename=caller.filename,
-        lineno=caller.lineno,
+        filename=caller.f_code.co_filename,
+        lineno=caller.f_lineno,
         srclocals=func_locals,
         srcglobals=func_globals,
     )
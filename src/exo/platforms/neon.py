@@ -34,10 +34,14 @@ class Neon(Memory):
             "float": (4, "float32x4_t"),
             "double": (2, "float64x2_t"),
             "_Float16": (8, "float16x8_t"),
+            "int8_t": (16, "int8x16_t"),
+            "int32_t": (4, "int32x4_t"),
         }
 
         if not prim_type in vec_types.keys():
-            raise MemGenError(f"{srcinfo}: Neon vectors must be f32/f64 (for now)")
+            raise MemGenError(
+                f"{srcinfo}: Neon vectors must be f16/f32/f64/i8/i32 (for now)"
+            )
 
         reg_width, C_reg_type_name = vec_types[prim_type]
 
@@ -249,6 +253,18 @@ def neon_vfmadd_1xf32_4xf32(
         dst[i] += lhs[0] * rhs[i]
 
 
+@instr("{dst_data} = vpaddq_f32({lhs_data}, {rhs_data});")
+def neon_vpaddq_4xf32(dst: [f32][4] @ Neon, lhs: [f32][4] @ Neon, rhs: [f32][4] @ Neon):
+    assert stride(dst, 0) == 1
+    assert stride(lhs, 0) == 1
+    assert stride(rhs, 0) == 1
+
+    for i in seq(0, 2):
+        dst[i] = lhs[2 * i] + lhs[2 * i + 1]
+    for i in seq(0, 2):
+        dst[2 + i] = rhs[2 * i] + rhs[2 * i + 1]
+
+
 # -----------------------------------------------
 # Load, Store, Broadcast, FMAdd, Mul, Add?
 #
@@ -505,6 +521,76 @@ def neon_vneg_2xf64(dst: [f64][2] @ Neon, src: [f64][2] @ Neon):
         dst[i] = -src[i]
 
 
+# --------------------------------------------------------------------------- #
+#   i8 / i32 Neon intrinsics
+# --------------------------------------------------------------------------- #
+
+# The dot-product instructions require ARMv8.2-A with the DotProd extension
+# (e.g. -march=armv8.2-a+dotprod).
+
+
+@instr("{dst_data} = vld1q_s8(&{src_data});")
+def neon_vld_16xi8(dst: [i8][16] @ Neon, src: [i8][16] @ DRAM):
+    assert stride(src, 0) == 1
+    assert stride(dst, 0) == 1
+
+    for i in seq(0, 16):
+        dst[i] = src[i]
+
+
+@instr("{dst_data} = vld1q_s32(&{src_data});")
+def neon_vld_4xi32(dst: [i32][4] @ Neon, src: [i32][4] @ DRAM):
+    assert stride(src, 0) == 1
+    assert stride(dst, 0) == 1
+
+    for i in seq(0, 4):
+        dst[i] = src[i]
+
+
+@instr("vst1q_s32(&{dst_data}, {src_data});")
+def neon_vst_4xi32(dst: [i32][4] @ DRAM, src: [i32][4] @ Neon):
+    assert stride(src, 0) == 1
+    assert stride(dst, 0) == 1
+
+    for i in seq(0, 4):
+        dst[i] = src[i]
+
+
+@instr("{dst_data} = vmovq_n_s32(0);")
+def neon_zero_4xi32(dst: [i32][4] @ Neon):
+    assert stride(dst, 0) == 1
+
+    for i in seq(0, 4):
+        dst[i] = 0.0
+
+
+@instr("{dst_data} = vdotq_s32({dst_data}, {lhs_data}, {rhs_data});")
+def neon_vdot_4xi32_16xi8(
+    dst: [i32][4] @ Neon, lhs: [i8][16] @ Neon, rhs: [i8][16] @ Neon
+):
+    assert stride(dst, 0) == 1
+    assert stride(lhs, 0) == 1
+    assert stride(rhs, 0) == 1
+
+    for i in seq(0, 4):
+        for j in seq(0, 4):
+            dst[i] += lhs[4 * i + j] * rhs[4 * i + j]
+
+
+@instr("{dst_data} = vdotq_laneq_s32({dst_data}, {lhs_data}, {rhs_data}, {lane});")
+def neon_vdot_4xi32_16xi8_lane(
+    dst: [i32][4] @ Neon, lhs: [i8][16] @ Neon, rhs: [i8][16] @ Neon, lane: index
+):
+    assert stride(dst, 0) == 1
+    assert stride(lhs, 0) == 1
+    assert stride(rhs, 0) == 1
+    assert lane >= 0
+    assert lane < 4
+    for i in seq(0, 4):
+        for j in seq(0, 4):
+            dst[i] += lhs[4 * i + j] * rhs[4 * lane + j]
+
+
 # --------------------------------------------------------------------------- #
 #   f32 to f64 conversion
 # --------------------------------------------------------------------------- #
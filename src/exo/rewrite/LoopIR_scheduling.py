@@ -563,10 +563,36 @@ def same_write_dest(proc_cursor, s1, s2):
     return same_index_exprs(proc_cursor, s1.idx, s1, s2.idx, s2)
 
 
+def _is_same_index_expr(e1, e2):
+    """
+    Cheap, conservative test that two index expressions are literally the
+    same: built from the same control variables and constants.  Those can
+    not change between two neighbouring statements, so no SMT query is needed.
+    """
+    if type(e1) is not type(e2):
+        return False
+    elif isinstance(e1, LoopIR.Read):
+        return not e1.idx and not e2.idx and e1.name == e2.name
+    elif isinstance(e1, LoopIR.Const):
+        return e1.val == e2.val
+    elif isinstance(e1, LoopIR.USub):
+        return _is_same_index_expr(e1.arg, e2.arg)
+    elif isinstance(e1, LoopIR.BinOp):
+        return (
+            e1.op == e2.op
+            and _is_same_index_expr(e1.lhs, e2.lhs)
+            and _is_same_index_expr(e1.rhs, e2.rhs)
+        )
+    return False
+
+
 def DoMergeWrites(c1, c2):
     s1, s2 = c1._node, c2._node
 
-    if not same_write_dest(c1.get_root(), s1, s2):
+    same_idx = len(s1.idx) == len(s2.idx) and all(
+        _is_same_index_expr(i1, i2) for i1, i2 in zip(s1.idx, s2.idx)
+    )
+    if not same_idx and not same_write_dest(c1.get_root(), s1, s2):
         raise SchedulingError("expected the left hand side's indices to be the same.")
 
     if any(
@@ -1442,6 +1468,20 @@ def DoLiftScope(inner_c):
     return ir, fwd
 
 
+def DoLiftScopeToTop(inner_c):
+    # the first lift must succeed; after that, lift until the statement
+    # reaches the top level or a lift is no longer legal
+    ir, fwd = DoLiftScope(inner_c)
+    while (stmt_c := fwd(inner_c)).parent() != stmt_c.root():
+        try:
+            ir, fwd_lift = DoLiftScope(stmt_c)
+        except SchedulingError:
+            break
+        fwd = _compose(fwd_lift, fwd)
+
+    return ir, fwd
+
+
 def DoLiftConstant(assign_c, loop_c):
     orig_proc = assign_c.get_root()
     assign_s = assign_c._node
@@ -1896,13 +1936,24 @@ def DoLiftAllocSimple(alloc_cursor, n_lifts):
     alloc_stmt = alloc_cursor._node
 
     assert isinstance(alloc_stmt, LoopIR.Alloc)
-    assert is_pos_int(n_lifts)
+    assert n_lifts is None or is_pos_int(n_lifts)
 
     szvars = set()
     if alloc_stmt.type.shape():
         szvars = set.union(*[_FV(sz) for sz in alloc_stmt.type.shape()])
 
     stmt_c = alloc_cursor
+    if n_lifts is None:
+        # lift as far as possible: up to the top of the proc, or up to the
+        # first loop whose iteration variable the allocation size depends on
+        while (par_c := stmt_c.parent()) != par_c.root():
+            if isinstance(par_c._node, LoopIR.For) and par_c._node.iter in szvars:
+                break
+            stmt_c = par_c
+        if stmt_c is alloc_cursor:
+            return alloc_cursor.get_root(), lambda x: x
+        return alloc_cursor._move(stmt_c.before())
+
     for i in range(n_lifts):
         try:
             stmt_c = stmt_c.parent()
@@ -2562,24 +2613,14 @@ class DoFissionLoops:
             return [single_stmt], []
 
 
-class DoAddUnsafeGuard(Cursor_Rewrite):
-    def __init__(self, proc_cursor, stmt_cursor, cond):
-        self.stmt = stmt_cursor._node
-        self.cond = cond
-        self.in_loop = False
-
-        super().__init__(proc_cursor)
+def DoAddUnsafeGuard(stmt_cursor, cond):
+    s = stmt_cursor._node
 
-    def map_s(self, sc):
-        s = sc._node
-        if s is self.stmt:
-            # Check_ExprEqvInContext(self.orig_proc,
-            #                       self.cond, [s],
-            #                       LoopIR.Const(True, T.bool, s.srcinfo))
-            s1 = Alpha_Rename([s]).result()
-            return [LoopIR.If(self.cond, s1, [], s.srcinfo)]
+    def wrapper(body):
+        return LoopIR.If(cond, body, [], s.srcinfo)
 
-        return super().map_s(sc)
+    ir, fwd = stmt_cursor.as_block()._wrap(wrapper, "body")
+    return ir, fwd
 
 
 def DoSpecialize(block_c, conds):
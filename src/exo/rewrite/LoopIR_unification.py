@@ -85,7 +85,7 @@ def DoReplace(subproc, block_cursor):
 
     # prevent name clashes between the statement block and sub-proc
     temp_subproc = Alpha_Rename(subproc).result()
-    stmts = [c._node for c in block_cursor[:n_stmts]]
+    stmts = block_cursor[:n_stmts].resolve_all()
     live_vars = Get_Live_Variables(block_cursor[0])
     new_args = Unification(temp_subproc, stmts, live_vars).result()
 
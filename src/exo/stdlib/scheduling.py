@@ -83,6 +83,7 @@ from ..API_scheduling import (
     #
     # guard rewriting
     lift_scope,
+    lift_scope_to_top,
     eliminate_dead_code,
     specialize,
     #
@@ -96,7 +97,16 @@ from ..API_scheduling import (
 
 from .analysis import check_call_mem_types
 from ..API_cursors import *
-from ..rewrite.LoopIR_unification import UnificationError as _UnificationError
+
+
+def __getattr__(name):
+    # keep _UnificationError importable without loading the unification
+    # engine on import (see _replace_helper)
+    if name == "_UnificationError":
+        from ..rewrite.LoopIR_unification import UnificationError
+
+        return UnificationError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --------------------------------------------------------------------------- #
@@ -231,6 +241,8 @@ def call_site_mem_aware_replace(proc, block_cursor, subproc, quiet=False):
 
 
 def _replace_helper(proc, subprocs, mem_aware, once):
+    # unification is only needed here, so defer loading it until first use
+    from ..rewrite.LoopIR_unification import UnificationError as _UnificationError
 
     if not isinstance(subprocs, list):
         subprocs = [subprocs]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from exo import proc, DRAM, config, instr
+from exo import proc, DRAM, config, instr, ExoType
 from exo.libs.memories import GEMM_SCRATCH
 from exo.libs.externs import *
 from exo.stdlib.scheduling import *
@@ -258,6 +258,19 @@ def test_config_write4():
         write_config(foo, foo.find("a = _").after(), Config, "tmp", "A[0] * A[1]")
 
 
+def test_config_write_bool_literal(golden):
+    ConfigControl = new_control_config()
+
+    @proc
+    def foo(n: size):
+        for i in seq(0, n):
+            pass
+
+    foo = write_config(foo, foo.find_loop("i").before(), ConfigControl, "b", True)
+    assert foo.find("ConfigControl.b = _").rhs().type() == ExoType.Bool
+    assert str(foo) == golden
+
+
 def test_config_bind(golden):
     ConfigLoad = new_config_ld()
 
@@ -48,12 +48,56 @@ def test_parent_cursor(proc_foo):
     assert jloop.parent() == iloop
 
 
+def test_parent_cursor_skips_window_access():
+    @proc
+    def foo(n: size, x: f32[n, n], y: f32[n]):
+        for i in seq(0, n):
+            y[i] = x[i, i]
+            z = x[i, 0:n]
+
+    window = foo.find("z = _").winexpr()
+    pt, (lo, hi) = window.idx()
+    assert pt.parent() == window
+    assert lo.parent() == window
+    assert hi.parent() == window
+
+    read = foo.find("y = _").rhs()
+    assert read.idx()[0].parent() == read
+    assert foo.find("for i in _:_").hi().parent() == foo.find("for i in _:_")
+
+
 def test_child_cursor(proc_foo):
     jloop = proc_foo.find("for j in _:_")
     iloop = proc_foo.find("for i in _:_")
     assert jloop == iloop.body()[0]
 
 
+def test_child_list_cursors_are_reused():
+    @proc
+    def foo(n: size, x: f32[n]):
+        for i in seq(0, n):
+            if i < 3:
+                x[i] = 1.0
+            else:
+                x[i] += x[i]
+
+    loop = foo.find_loop("i")
+    assert loop.body() is loop.body()
+
+    if_stmt = foo.find("if _: _")
+    assert if_stmt.body() is if_stmt.body()
+    assert if_stmt.orelse() is if_stmt.orelse()
+
+    assign = foo.find("x = _")
+    assert assign.idx() is assign.idx()
+    assert assign.idx() == foo.find("x = _").idx()
+
+    reduce = foo.find("x += _")
+    assert reduce.idx() is reduce.idx()
+    read = reduce.rhs()
+    assert read.idx() is read.idx()
+
+
 def test_asblock_cursor(proc_foo):
     jloop = proc_foo.find("for j in _:_")
     iloop = proc_foo.find("for i in _:_")
@@ -355,3 +355,177 @@ def test_neon_simple_math_scheduling(compiler, simple_math_neon_sched):
 
         fn(None, n, x, y)
         assert np.allclose(x, expected)
+
+
+@pytest.fixture
+def dot_i8_neon_sched():
+    @proc
+    def dot_i8(C: i32[4] @ DRAM, A: i8[16] @ DRAM, B: i8[16] @ DRAM):
+        for i in seq(0, 4):
+            for j in seq(0, 4):
+                C[i] += A[4 * i + j] * B[4 * i + j]
+
+    def sched_neon(p=dot_i8):
+        p = stage_mem(p, "for i in _:_", "C[0:4]", "C_reg")
+        p = stage_mem(p, "for i in _:_ #0", "A[0:16]", "A_reg")
+        p = stage_mem(p, "for i in _:_ #0", "B[0:16]", "B_reg")
+
+        p = set_memory(p, "C_reg", Neon)
+        p = set_memory(p, "A_reg", Neon)
+        p = set_memory(p, "B_reg", Neon)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_4xi32)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_16xi8)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_16xi8)
+        p = replace(p, "for i in _:_ #0", neon_vdot_4xi32_16xi8)
+        p = replace(p, "for i0 in _:_ #0", neon_vst_4xi32)
+
+        p = simplify(p)
+        return p
+
+    return sched_neon()
+
+
+def test_gen_neon_dot_i8(golden, dot_i8_neon_sched):
+    assert str(dot_i8_neon_sched) == golden
+
+
+def test_gen_neon_dot_i8_c(dot_i8_neon_sched):
+    c_code = dot_i8_neon_sched.c_code_str()
+    assert "C_reg = vdotq_s32(C_reg, A_reg, B_reg);" in c_code
+
+
+@pytest.mark.isa("neon")
+def test_neon_dot_i8(compiler, dot_i8_neon_sched):
+    """
+    Compute C[i] += sum_j A[4 * i + j] * B[4 * i + j]
+    """
+
+    fn = compiler.compile(
+        dot_i8_neon_sched, skip_on_fail=True, CMAKE_C_FLAGS="-mcpu=apple-a14"
+    )
+
+    A = np.array([i - 8 for i in range(16)], dtype=np.int8)
+    B = np.array([3 * i - 20 for i in range(16)], dtype=np.int8)
+    C = np.array([1, 2, 3, 4], dtype=np.int32)
+    expected = C + (A.astype(np.int32) * B).reshape(4, 4).sum(axis=1)
+
+    fn(None, C, A, B)
+    assert np.array_equal(C, expected)
+
+
+@pytest.fixture
+def dot_i8_lane_neon_sched():
+    @proc
+    def dot_i8_lane(C: i32[4] @ DRAM, A: i8[16] @ DRAM, B: i8[16] @ DRAM):
+        C_reg: i32[4] @ DRAM
+        for i in seq(0, 4):
+            C_reg[i] = 0.0
+        for i in seq(0, 4):
+            for j in seq(0, 4):
+                C_reg[i] += A[4 * i + j] * B[4 + j]
+        for i in seq(0, 4):
+            C[i] = C_reg[i]
+
+    def sched_neon(p=dot_i8_lane):
+        p = stage_mem(p, "for i in _:_ #1", "A[0:16]", "A_reg")
+        p = stage_mem(p, "for i in _:_ #1", "B[0:16]", "B_reg")
+
+        p = set_memory(p, "C_reg", Neon)
+        p = set_memory(p, "A_reg", Neon)
+        p = set_memory(p, "B_reg", Neon)
+        p = replace(p, "for i in _:_ #0", neon_zero_4xi32)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_16xi8)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_16xi8)
+        p = replace(p, "for i in _:_ #0", neon_vdot_4xi32_16xi8_lane)
+        p = replace(p, "for i in _:_ #0", neon_vst_4xi32)
+
+        p = simplify(p)
+        return p
+
+    return sched_neon()
+
+
+def test_gen_neon_dot_i8_lane(golden, dot_i8_lane_neon_sched):
+    assert str(dot_i8_lane_neon_sched) == golden
+
+
+def test_gen_neon_dot_i8_lane_c(dot_i8_lane_neon_sched):
+    c_code = dot_i8_lane_neon_sched.c_code_str()
+    assert "C_reg = vmovq_n_s32(0);" in c_code
+    assert "C_reg = vdotq_laneq_s32(C_reg, A_reg, B_reg, (1));" in c_code
+
+
+@pytest.mark.isa("neon")
+def test_neon_dot_i8_lane(compiler, dot_i8_lane_neon_sched):
+    """
+    Compute C[i] = sum_j A[4 * i + j] * B[4 + j]
+    """
+
+    fn = compiler.compile(
+        dot_i8_lane_neon_sched, skip_on_fail=True, CMAKE_C_FLAGS="-mcpu=apple-a14"
+    )
+
+    A = np.array([i - 8 for i in range(16)], dtype=np.int8)
+    B = np.array([3 * i - 20 for i in range(16)], dtype=np.int8)
+    C = np.zeros(4, dtype=np.int32)
+    expected = (A.astype(np.int32).reshape(4, 4) * B[4:8]).sum(axis=1)
+
+    fn(None, C, A, B)
+    assert np.array_equal(C, expected)
+
+
+@pytest.fixture
+def pairwise_add_neon_sched():
+    @proc
+    def pairwise_add(C: f32[4] @ DRAM, A: f32[4] @ DRAM, B: f32[4] @ DRAM):
+        for i in seq(0, 2):
+            C[i] = A[2 * i] + A[2 * i + 1]
+        for i in seq(0, 2):
+            C[2 + i] = B[2 * i] + B[2 * i + 1]
+
+    def sched_neon(p=pairwise_add):
+        p = stage_mem(p, p.body(), "C[0:4]", "C_reg")
+        p = stage_mem(p, p.body(), "A[0:4]", "A_reg")
+        p = stage_mem(p, p.body(), "B[0:4]", "B_reg")
+        p = simplify(p)
+
+        p = set_memory(p, "A_reg", Neon)
+        p = set_memory(p, "B_reg", Neon)
+        p = set_memory(p, "C_reg", Neon)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_4xf32)
+        p = replace(p, "for i0 in _:_ #0", neon_vld_4xf32)
+        p = replace(p, p.find_loop("i").expand(0, 1), neon_vpaddq_4xf32)
+        p = replace(p, "for i0 in _:_ #0", neon_vst_4xf32)
+        return p
+
+    return sched_neon()
+
+
+def test_gen_neon_pairwise_add(golden, pairwise_add_neon_sched):
+    assert str(pairwise_add_neon_sched) == golden
+
+
+def test_gen_neon_pairwise_add_c(pairwise_add_neon_sched):
+    c_code = pairwise_add_neon_sched.c_code_str()
+    assert "C_reg = vpaddq_f32(A_reg, B_reg);" in c_code
+
+
+@pytest.mark.isa("neon")
+def test_neon_pairwise_add(compiler, pairwise_add_neon_sched):
+    """
+    Compute C = [A0 + A1, A2 + A3, B0 + B1, B2 + B3]
+    """
+
+    fn = compiler.compile(
+        pairwise_add_neon_sched, skip_on_fail=True, CMAKE_C_FLAGS="-mcpu=apple-a14"
+    )
+
+    A = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
+    B = np.array([5.0, 6.0, 7.0, 8.0], dtype=np.float32)
+    C = np.zeros(4, dtype=np.float32)
+    expected = np.concatenate(
+        [A.reshape(2, 2).sum(axis=1), B.reshape(2, 2).sum(axis=1)]
+    )
+
+    fn(None, C, A, B)
+    assert np.array_equal(C, expected)
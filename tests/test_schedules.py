@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from enum import IntEnum
+
 import pytest
 
 from exo import ParseFragmentError, proc, DRAM, Procedure, config
@@ -273,6 +275,16 @@ def test_add_loop5_fail():
         add_loop(foo, "x += 2.0", "i", 5)
 
 
+def test_add_loop_block_fail():
+    @proc
+    def foo(x: R):
+        x = 1.0
+        x = 2.0
+
+    with pytest.raises(ValueError, match="expected a block of size 1"):
+        add_loop(foo, foo.body(), "i", 5)
+
+
 def test_add_loop6_runs_fail():
     @proc
     def foo(x: R):
@@ -874,6 +886,28 @@ def test_lift_alloc_simple_error():
         lift_alloc(bar, "tmp_a : _", n_lifts=3)
 
 
+def test_lift_alloc_simple_saturate():
+    @proc
+    def bar(n: size, A: i8[n]):
+        for k in seq(0, n):
+            for i in seq(0, n):
+                for j in seq(0, n):
+                    tmp_a: i8[k + 1]
+                    tmp_a[k] = A[i]
+                    tmp_b: i8
+                    tmp_b = A[j]
+
+    assert str(lift_alloc(bar, "tmp_a : _", n_lifts=None)) == str(
+        lift_alloc(bar, "tmp_a : _", n_lifts=2)
+    )
+    assert str(lift_alloc(bar, "tmp_b : _", n_lifts=None)) == str(
+        lift_alloc(bar, "tmp_b : _", n_lifts=3)
+    )
+
+    bar = lift_alloc(bar, "tmp_a : _", n_lifts=2)
+    assert str(lift_alloc(bar, "tmp_a : _", n_lifts=None)) == str(bar)
+
+
 def test_autolift_alloc_error():
     @proc
     def bar(n: size, A: i8[n]):
@@ -1027,6 +1061,20 @@ def test_expand_dim7():
         foo = expand_dim(foo, "a : _", "n", "i")
 
 
+def test_expand_dim_int_subclass():
+    class Dim(IntEnum):
+        PAD = 8
+
+    @proc
+    def foo(n: size):
+        for i in seq(0, n):
+            a: i8
+            a = 0.0
+
+    expected = str(expand_dim(foo, "a : _", 8, 0))
+    assert str(expand_dim(foo, "a : _", Dim.PAD, 0)) == expected
+
+
 def test_pattern_matching_id_in_scheduling_ops(golden):
     @proc
     def bar(n: size, ret: i8):
@@ -1107,6 +1155,35 @@ def test_divide_dim_fail_2():
             divide_dim(foo, "x", i, 15)
 
 
+def test_divide_dim_fail_3():
+    @proc
+    def foo(n: size, m: size):
+        x: R[n, 12, m]
+
+    with pytest.raises(
+        TypeError, match="argument 2, 'dim_idx' to divide_dim: expected an integer"
+    ):
+        divide_dim(foo, "x", True, 4)
+
+    with pytest.raises(
+        TypeError, match="argument 3, 'quotient' to divide_dim: expected a positive"
+    ):
+        divide_dim(foo, "x", 1, True)
+
+
+def test_divide_dim_int_subclass():
+    class Dim(IntEnum):
+        MID = 1
+        VEC = 4
+
+    @proc
+    def foo(n: size, m: size):
+        x: R[n, 12, m]
+
+    expected = str(divide_dim(foo, "x", 1, 4))
+    assert str(divide_dim(foo, "x", Dim.MID, Dim.VEC)) == expected
+
+
 def test_mult_dim_1(golden):
     @proc
     def foo(n: size, m: size, A: R[n + m + 12]):
@@ -1731,6 +1808,44 @@ def test_merge_writes_array_indexing(golden):
     assert str(bar) == golden
 
 
+def test_merge_writes_equivalent_indexing(golden):
+    @proc
+    def bar(x: R[3], y: R[3], z: R):
+        for i in seq(0, 3):
+            for j in seq(0, 3):
+                tmp: R[5, 3]
+                tmp[i + j, j] = x[i]
+                tmp[j + i, j] += y[j]
+
+    bar = merge_writes(bar, "tmp[i+j, j] = x[i]; tmp[j+i, j] += y[j]")
+    assert str(bar) == golden
+
+
+def test_merge_writes_identical_indexing(golden):
+    @proc
+    def bar(x: R[3, 3], y: R[3]):
+        for i in seq(0, 3):
+            for j in seq(0, 3):
+                x[i, j] = y[i]
+                x[i, j] += y[j]
+
+    bar = merge_writes(bar, "x[i, j] = y[i]; x[i, j] += y[j]")
+    assert str(bar) == golden
+
+
+def test_merge_writes_shifted_indexing_error():
+    @proc
+    def bar(x: R[4], y: R):
+        for i in seq(0, 3):
+            x[i] = y
+            x[i + 1] += y
+
+    with pytest.raises(
+        SchedulingError, match="expected the left hand side's indices to be the same."
+    ):
+        bar = merge_writes(bar, "x[i] = y; x[i+1] += y")
+
+
 def test_merge_writes_type_check(golden):
     @proc
     def bar(y: f32):
@@ -2857,6 +2972,20 @@ def test_lift_scope(golden):
     assert str(foo) == golden
 
 
+def test_lift_scope_to_top(golden):
+    @proc
+    def foo(n: size, m: size, x: R[n, m]):
+        for i in seq(0, n):
+            for j in seq(0, m):
+                if n < 10:
+                    if i < 5:
+                        x[i, j] = 1.0
+
+    foo = lift_scope_to_top(foo, "if n < 10: _")
+    foo = lift_scope_to_top(foo, "if i < 5: _")
+    assert str(foo) == golden
+
+
 def test_lift_scope_lift_for_when_outer_if_has_noelse_error(golden):
     @proc
     def foo(n: size, x: R[n]):
@@ -3900,6 +4029,15 @@ def test_replace_all_length_mismatch(golden):
     assert str(foo) == golden
 
 
+def test_unification_error_reexports():
+    from exo.rewrite.LoopIR_unification import UnificationError
+    from exo.API_scheduling import UnificationError as api_error
+    from exo.stdlib.scheduling import _UnificationError as stdlib_error
+
+    assert api_error is UnificationError
+    assert stdlib_error is UnificationError
+
+
 def test_eliminate_dead_code(golden):
     @proc
     def foo():
@@ -4255,6 +4393,18 @@ def test_specialize(golden):
     assert str(foo) == golden
 
 
+def test_add_unsafe_guard(golden):
+    @proc
+    def foo(n: size, x: R[n]):
+        for i in seq(0, n):
+            x[i] = 1.0
+
+    loop = foo.find_loop("i")
+    foo = add_unsafe_guard(foo, loop.body(), "i < 4")
+    assert str(foo) == golden
+    assert foo.forward(loop).body()[0] == foo.find("if i < 4: _")
+
+
 def test_specialize_sizes(golden):
     @proc
     def gemm(